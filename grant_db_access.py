@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """Grant database instance access to the app service principal using the Databricks API."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from databricks.sdk import WorkspaceClient
 
 # Initialize workspace client
@@ -11,8 +15,22 @@ w = WorkspaceClient(profile="DEFAULT")
 host = w.config.host
 token = w.config.token
 
-# Service principal from the app
-sp_client_id = "d90946d6-1656-467b-8879-0ce59027f19e"
+# Reuse one HTTP session for all control-plane calls: keep-alive avoids a
+# fresh TCP+TLS handshake per request, and the retry policy backs off on
+# transient 429/5xx responses
+session = requests.Session()
+session.headers.update({
+    "Authorization": f"Bearer {token}",
+    "Content-Type": "application/json"
+})
+session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]),
+))
+
+# Service principals from the app - extend this list to grant several at once
+sp_client_ids = ["d90946d6-1656-467b-8879-0ce59027f19e"]
 database_instance_name = "LPT-LKB-2"
 
 # Get database instance details
@@ -20,47 +38,58 @@ instance = w.database.get_database_instance(database_instance_name)
 print(f"Database instance: {instance.name}")
 print(f"UID: {instance.uid}")
 
-# Try to update the database instance with allowed service principals
-# Using the REST API directly
-url = f"{host}/api/2.0/postgres-instances/{instance.uid}"
 
-# Try PATCH to add allowed service principals
-payload = {
-    "allowed_service_principals": [sp_client_id]
-}
-
-headers = {
-    "Authorization": f"Bearer {token}",
-    "Content-Type": "application/json"
-}
+def grant_access(instance_uid: str, sp_client_id: str) -> bool:
+    """Grant one service principal access to the database instance.
 
-print(f"\nAttempting to grant access to service principal: {sp_client_id}")
-response = requests.patch(url, json=payload, headers=headers)
+    Tries the primary postgres-instances endpoint first, falling back to the
+    alternative database-instances endpoint on 404. Returns True on success.
+    """
+    # Try to update the database instance with allowed service principals
+    # Using the REST API directly
+    url = f"{host}/api/2.0/postgres-instances/{instance_uid}"
 
-if response.status_code == 200:
-    print("✓ Successfully granted database access!")
-    print(response.json())
-elif response.status_code == 404:
-    print(f"⚠️  Database API endpoint not found. Trying alternative...")
+    # Try PATCH to add allowed service principals
+    payload = {
+        "allowed_service_principals": [sp_client_id]
+    }
 
-    # Try alternative endpoint
-    alt_url = f"{host}/api/2.0/database-instances/{instance.uid}"
-    response = requests.patch(alt_url, json=payload, headers=headers)
+    print(f"Attempting to grant access to service principal: {sp_client_id}")
+    response = session.patch(url, json=payload)
 
     if response.status_code == 200:
-        print("✓ Successfully granted database access via alternative endpoint!")
+        print(f"✓ Successfully granted database access to {sp_client_id}!")
         print(response.json())
-    else:
-        print(f"✗ Failed: {response.status_code}")
-        print(response.text)
-else:
-    print(f"✗ Failed: {response.status_code}")
+        return True
+
+    if response.status_code == 404:
+        print(f"⚠️  Database API endpoint not found. Trying alternative...")
+
+        # Try alternative endpoint
+        alt_url = f"{host}/api/2.0/database-instances/{instance_uid}"
+        response = session.patch(alt_url, json=payload)
+
+        if response.status_code == 200:
+            print(f"✓ Successfully granted database access to {sp_client_id} via alternative endpoint!")
+            print(response.json())
+            return True
+
+    print(f"✗ Failed for {sp_client_id}: {response.status_code}")
     print(response.text)
+    return False
+
+
+# Grant all principals in parallel - the PATCH calls are independent, so
+# wall time drops from the sum of the round-trips to roughly the slowest one
+with ThreadPoolExecutor(max_workers=16) as executor:
+    results = list(executor.map(lambda sp: grant_access(instance.uid, sp), sp_client_ids))
 
-print("\n" + "="*70)
-print("If automated grant failed, please manually grant access:")
-print(f"1. Go to: {host}/database-instances")
-print(f"2. Select database: {database_instance_name}")
-print(f"3. Add service principal: {sp_client_id}")
-print(f"4. Grant: CONNECT and CREATE permissions")
-print("="*70)
+if not all(results):
+    failed = [sp for sp, ok in zip(sp_client_ids, results) if not ok]
+    print("\n" + "="*70)
+    print("If automated grant failed, please manually grant access:")
+    print(f"1. Go to: {host}/database-instances")
+    print(f"2. Select database: {database_instance_name}")
+    print(f"3. Add service principal(s): {', '.join(failed)}")
+    print(f"4. Grant: CONNECT and CREATE permissions")
+    print("="*70)
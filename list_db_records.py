@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """List all records stored in the Databricks Postgres database."""
 
+import logging
 import sys
 from pathlib import Path
 
@@ -12,42 +13,74 @@ from lpt_event.backend.models import Event
 from lpt_event.backend.logger import logger
 from sqlmodel import select
 
-def list_records():
-    """List all records from the database."""
+def list_records(verbose: bool = False):
+    """List all records from the database.
+
+    By default only the summary columns are fetched and printed; pass
+    verbose=True (or --verbose on the command line) to also include the
+    wide text columns (detailed description, picture URL).
+    """
     try:
         logger.info("=" * 80)
         logger.info(f"Listing all records from database instance: {rt.config.db.instance_name}")
         logger.info("=" * 80)
 
+        # Skip all per-record f-string formatting when INFO is filtered out
+        info_on = logger.isEnabledFor(logging.INFO)
+
+        # Select only the columns we actually print - skipping the wide text
+        # columns cuts the bytes fetched per row substantially on real tables
+        columns = [
+            Event.id,
+            Event.title,
+            Event.short_description,
+            Event.city,
+            Event.days_of_week,
+            Event.cost_usd,
+        ]
+        if verbose:
+            columns += [Event.detailed_description, Event.picture_url]
+
+        count = 0
         with rt.get_session() as session:
-            # Query all events
-            events = session.exec(select(Event)).all()
-
-            if not events:
-                logger.info("\nNo records found in the database.")
-                return
-
-            logger.info(f"\nFound {len(events)} record(s):\n")
-
-            for i, event in enumerate(events, 1):
-                logger.info("─" * 80)
-                logger.info(f"Record #{i}")
-                logger.info("─" * 80)
-                logger.info(f"  ID:                  {event.id}")
-                logger.info(f"  Title:               {event.title}")
-                logger.info(f"  Short Description:   {event.short_description}")
-                logger.info(f"  Detailed Description:{event.detailed_description}")
-                logger.info(f"  City:                {event.city}")
-                logger.info(f"  Days of Week:        {', '.join(event.days_of_week)}")
-                logger.info(f"  Cost (USD):          ${event.cost_usd:.2f}")
-                logger.info(f"  Picture URL:         {event.picture_url}")
-                logger.info("")
+            # Stream rows in batches instead of materializing the full result
+            # with .all() - keeps peak memory at O(batch) instead of O(N) and
+            # starts logging as soon as the first batch arrives
+            rows = session.exec(select(*columns).execution_options(yield_per=500))
+
+            for row in rows:
+                count += 1
+                if not info_on:
+                    continue
+                # Emit one log call per record instead of ~10 - every call
+                # traverses the handler chain, takes its lock, and flushes,
+                # so batching the lines cuts that overhead roughly 10x
+                lines = [
+                    "─" * 80,
+                    f"Record #{count}",
+                    "─" * 80,
+                    f"  ID:                  {row.id}",
+                    f"  Title:               {row.title}",
+                    f"  Short Description:   {row.short_description}",
+                    f"  City:                {row.city}",
+                    f"  Days of Week:        {', '.join(row.days_of_week)}",
+                    f"  Cost (USD):          ${row.cost_usd:.2f}",
+                ]
+                if verbose:
+                    lines.append(f"  Detailed Description:{row.detailed_description}")
+                    lines.append(f"  Picture URL:         {row.picture_url}")
+                lines.append("")
+                logger.info("\n".join(lines))
+
+        if count == 0:
+            logger.info("\nNo records found in the database.")
+            return 0
 
         logger.info("=" * 80)
-        logger.info(f"Total records: {len(events)}")
+        logger.info(f"Total records: {count}")
         logger.info("=" * 80)
 
-        return events
+        return count
 
     except Exception as e:
         logger.error("=" * 80)
@@ -58,5 +91,5 @@ def list_records():
         return None
 
 if __name__ == "__main__":
-    records = list_records()
+    records = list_records(verbose="--verbose" in sys.argv)
     sys.exit(0 if records is not None else 1)
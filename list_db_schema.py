@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """List all tables and schemas stored in the Databricks Postgres database."""
 
+import logging
 import sys
 from pathlib import Path
 
@@ -22,12 +23,25 @@ def list_schema():
         # Get SQLAlchemy inspector
         inspector = inspect(rt.engine)
 
-        # Get all schemas
-        schemas = inspector.get_schema_names()
-        logger.info(f"\nAvailable schemas: {', '.join(schemas)}")
+        if rt.engine.dialect.name == "postgresql":
+            # Query pg_catalog directly: one cheap round-trip each, instead
+            # of the portable-but-slow information_schema joins the
+            # Inspector helpers lower into on PostgreSQL
+            with rt.get_session() as session:
+                conn = session.connection()
+                schemas = conn.execute(text(
+                    "SELECT nspname FROM pg_namespace "
+                    "WHERE nspname !~ '^pg_' AND nspname <> 'information_schema'"
+                )).scalars().all()
+                table_names = conn.execute(text(
+                    "SELECT tablename FROM pg_tables WHERE schemaname = 'public'"
+                )).scalars().all()
+        else:
+            # Fallback to the portable Inspector helpers for other dialects
+            schemas = inspector.get_schema_names()
+            table_names = inspector.get_table_names(schema='public')
 
-        # Get all table names (default schema is 'public' for PostgreSQL)
-        table_names = inspector.get_table_names(schema='public')
+        logger.info(f"\nAvailable schemas: {', '.join(schemas)}")
 
         if not table_names:
             logger.info("\nNo tables found in the database.")
@@ -35,15 +49,43 @@ def list_schema():
 
         logger.info(f"\nFound {len(table_names)} table(s) in schema 'public':\n")
 
+        # Reflect all tables in one pass per artifact kind - get_multi_*
+        # fetches every table's metadata in a single query each, instead of
+        # four separate round-trips per table
+        all_columns = inspector.get_multi_columns(schema='public')
+        all_pks = inspector.get_multi_pk_constraint(schema='public')
+        all_fks = inspector.get_multi_foreign_keys(schema='public')
+        all_indexes = inspector.get_multi_indexes(schema='public')
+
+        # Fetch all row counts in a single round-trip instead of opening a
+        # session and running COUNT(*) once per table. Table names come from
+        # the inspector, so interpolating them into the query is safe.
+        counts_sql = " UNION ALL ".join(
+            f'SELECT \'{t}\' AS name, COUNT(*) AS c FROM "{t}"' for t in table_names
+        )
+        with rt.get_session() as session:
+            row_counts = dict(session.connection().execute(text(counts_sql)).all())
+
+        # Skip all per-table f-string formatting when INFO is filtered out
+        info_on = logger.isEnabledFor(logging.INFO)
+
         for table_name in table_names:
-            logger.info("=" * 80)
-            logger.info(f"TABLE: {table_name}")
-            logger.info("=" * 80)
+            if not info_on:
+                break
+            key = ('public', table_name)
+            # Collect all lines for this table and emit them in a single
+            # logger.info call - one lock acquisition + flush per table
+            # instead of one per column/constraint/index line
+            lines = [
+                "=" * 80,
+                f"TABLE: {table_name}",
+                "=" * 80,
+            ]
 
             # Get columns
-            columns = inspector.get_columns(table_name, schema='public')
-            logger.info("\nColumns:")
-            logger.info("─" * 80)
+            columns = all_columns.get(key, [])
+            lines.append("\nColumns:")
+            lines.append("─" * 80)
 
             for col in columns:
                 col_name = col['name']
@@ -51,40 +93,39 @@ def list_schema():
                 nullable = "NULL" if col['nullable'] else "NOT NULL"
                 default = f"DEFAULT {col['default']}" if col.get('default') else ""
 
-                logger.info(f"  • {col_name:25s} {col_type:20s} {nullable:10s} {default}")
+                lines.append(f"  • {col_name:25s} {col_type:20s} {nullable:10s} {default}")
 
             # Get primary keys
-            pk = inspector.get_pk_constraint(table_name, schema='public')
+            pk = all_pks.get(key)
             if pk and pk.get('constrained_columns'):
-                logger.info("\nPrimary Key:")
-                logger.info("─" * 80)
-                logger.info(f"  {', '.join(pk['constrained_columns'])}")
+                lines.append("\nPrimary Key:")
+                lines.append("─" * 80)
+                lines.append(f"  {', '.join(pk['constrained_columns'])}")
 
             # Get foreign keys
-            fks = inspector.get_foreign_keys(table_name, schema='public')
+            fks = all_fks.get(key, [])
             if fks:
-                logger.info("\nForeign Keys:")
-                logger.info("─" * 80)
+                lines.append("\nForeign Keys:")
+                lines.append("─" * 80)
                 for fk in fks:
-                    logger.info(f"  • {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
+                    lines.append(f"  • {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
 
             # Get indexes
-            indexes = inspector.get_indexes(table_name, schema='public')
+            indexes = all_indexes.get(key, [])
             if indexes:
-                logger.info("\nIndexes:")
-                logger.info("─" * 80)
+                lines.append("\nIndexes:")
+                lines.append("─" * 80)
                 for idx in indexes:
                     idx_name = idx['name']
                     idx_cols = ', '.join(col for col in idx['column_names'] if col is not None)
                     unique = "UNIQUE" if idx.get('unique') else ""
-                    logger.info(f"  • {idx_name}: ({idx_cols}) {unique}")
+                    lines.append(f"  • {idx_name}: ({idx_cols}) {unique}")
 
-            # Get row count
-            with rt.get_session() as session:
-                row_count = session.scalar(text(f'SELECT COUNT(*) FROM "{table_name}"')) or 0
-                logger.info(f"\nRow Count: {row_count}")
+            # Get row count (from the batched query above)
+            lines.append(f"\nRow Count: {row_counts.get(table_name, 0)}")
 
-            logger.info("")
+            lines.append("")
+            logger.info("\n".join(lines))
 
         logger.info("=" * 80)
         logger.info(f"Total tables: {len(table_names)}")
@@ -1,9 +1,10 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 from .config import conf
 from .router import api
-from .utils import add_not_found_handler
+from .utils import CachedStaticFiles, ScanPathFilter, add_not_found_handler
 from .runtime import rt
 from .logger import logger
 
@@ -19,8 +20,9 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting app with configuration:\n{conf.model_dump_json(indent=2)}")
 
     # Validate database connectivity before accepting requests
-    # This fails fast if database is misconfigured
-    rt.validate_db()
+    # This fails fast if database is misconfigured. Runs on a worker thread
+    # so the event loop stays responsive during the blocking round-trips.
+    await asyncio.to_thread(rt.validate_db)
 
     # Create tables and seed demo data if needed
     # Safe to call multiple times - won't recreate existing tables
@@ -30,8 +32,19 @@ async def lifespan(app: FastAPI):
     # Cleanup code would go after yield (none needed currently)
 
 
-app = FastAPI(title=f"{conf.app_name}", lifespan=lifespan)
-ui = StaticFiles(directory=conf.static_assets_path, html=True)
+# At the locked fastapi (0.127.x), serialize_response hands the response
+# class a plain Python dict, and the default JSONResponse encodes it with
+# stdlib json.dumps. ORJSONResponse swaps in the orjson C serializer, which
+# is several times faster on list-of-dicts payloads like /api/events.
+# (Newer fastapi deprecates this in favor of serializing response_model
+# output straight to bytes via Pydantic - revisit when bumping the pin.)
+app = FastAPI(
+    title=f"{conf.app_name}",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+# CachedStaticFiles marks hashed assets immutable so browsers keep them cached
+ui = CachedStaticFiles(directory=conf.static_assets_path, html=True)
 
 # CRITICAL: Order matters! API routes must be included BEFORE mounting static files
 #
@@ -47,3 +60,7 @@ app.mount("/", ui)  # Catch-all mount must come last
 # Add custom 404 handler for unmatched routes
 # This ensures consistent error responses
 add_not_found_handler(app)
+
+# Outermost middleware: answer known vulnerability-scanner probes with
+# prebuilt 404 bytes before the routing table or exception pipeline runs
+app.add_middleware(ScanPathFilter)
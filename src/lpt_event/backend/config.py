@@ -1,3 +1,4 @@
+from functools import cached_property
 from importlib import resources
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
@@ -12,10 +13,13 @@ from pydantic.fields import _Unset
 project_root = Path(__file__).parent.parent.parent.parent
 env_file = project_root / ".env"
 
-# Load environment variables from .env file if it exists
-# This is useful for local development to avoid setting env vars manually
-if env_file.exists():
-    load_dotenv(dotenv_path=env_file)
+# Load environment variables from .env into os.environ in a single pass.
+# This has to stay an explicit load_dotenv (rather than pydantic-settings'
+# env_file support) because .env also carries non-LPT_EVENT variables such
+# as DATABRICKS_CONFIG_PROFILE that the Databricks SDK reads from the
+# environment. load_dotenv is a no-op for a missing file, so no extra
+# existence check is needed.
+load_dotenv(dotenv_path=env_file)
 
 
 class DatabaseConfig(BaseModel):
@@ -40,6 +44,22 @@ class DatabaseConfig(BaseModel):
         instance_name (str): Database instance identifier. Use "sqlite-memory"
             for local development with SQLite, or the Databricks instance name
             for production (e.g., "LPT-LKB-2").
+        pool_size (int): Number of persistent connections kept in the
+            SQLAlchemy pool. Defaults to 10.
+        max_overflow (int): Extra connections allowed beyond pool_size under
+            burst load. Defaults to 20.
+        pool_recycle (int): Seconds after which pooled connections are
+            recycled. Invariant: keep this below the database credential TTL
+            minus a safety window (Databricks tokens last ~1h, so the 1800s
+            default leaves ample margin). Raising it past the TTL trades
+            recycle cost for connection failures at rotation time; with
+            pool_pre_ping enabled those surface as transparent reconnects
+            rather than request errors, but still cost a round-trip.
+            Defaults to 1800.
+        pool_timeout (int): Seconds a request waits for a free connection
+            before erroring when the pool is exhausted. Defaults to 30.
+        slow_query_ms (int): Queries slower than this many milliseconds are
+            logged as warnings. Defaults to 100.
 
     Example:
         Environment variables for Databricks Postgres:
@@ -56,6 +76,26 @@ class DatabaseConfig(BaseModel):
         description="The name of the database", default="databricks_postgres"
     )
     instance_name: str = Field(description="The name of the database instance")
+    pool_size: int = Field(
+        description="Number of persistent connections in the SQLAlchemy pool",
+        default=10,
+    )
+    max_overflow: int = Field(
+        description="Extra connections allowed beyond pool_size under burst load",
+        default=20,
+    )
+    pool_recycle: int = Field(
+        description="Seconds after which pooled connections are recycled",
+        default=1800,
+    )
+    pool_timeout: int = Field(
+        description="Seconds to wait for a free pooled connection",
+        default=30,
+    )
+    slow_query_ms: int = Field(
+        description="Log queries slower than this threshold in milliseconds",
+        default=100,
+    )
 
 
 class AppConfig(BaseSettings):
@@ -72,7 +112,8 @@ class AppConfig(BaseSettings):
         LPT_EVENT_DB__DATABASE_NAME=databricks_postgres
     """
     model_config = SettingsConfigDict(
-        env_file=env_file,  # Load from .env file if present
+        # No env_file here: .env is already exported to os.environ by the
+        # single load_dotenv pass above, so a second parse would be redundant
         env_prefix=f"{app_slug.upper()}_",  # All env vars must start with LPT_EVENT_
         extra="ignore",  # Ignore extra env vars that don't match our schema
         env_nested_delimiter="__",  # Use __ to set nested config (e.g., DB__PORT sets db.port)
@@ -81,13 +122,16 @@ class AppConfig(BaseSettings):
     api_prefix: str = Field(default="/api")  # All API routes will be mounted under this prefix
     db: DatabaseConfig = _Unset  # Database configuration (required in production)
 
-    @property
+    @cached_property
     def static_assets_path(self) -> Path:
         """
         Returns the path to built frontend assets.
 
         The frontend build process outputs files to src/lpt_event/__dist__/
         which gets included in the Python package distribution.
+
+        Cached because resources.files walks the importlib finder chain;
+        the location never changes for the lifetime of the process.
         """
         return Path(str(resources.files(app_slug))).joinpath("__dist__")
 
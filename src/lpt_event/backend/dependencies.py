@@ -2,50 +2,67 @@ from databricks.sdk import WorkspaceClient
 from fastapi import Header, Request
 from typing import Annotated, Generator
 from sqlmodel import Session
-from sqlalchemy import create_engine, event
+from functools import lru_cache
 import base64
 import json
 from .runtime import rt
 from .config import conf
 from .logger import logger
 
+# Username claims to probe, in order of preference. Different OAuth
+# providers use different claim names for the username.
+_USERNAME_CLAIMS = ("email", "sub", "upn", "preferred_username")
+
+
+@lru_cache(maxsize=4096)
+def _decode_jwt_payload(token: str) -> dict:
+    """
+    Decode the payload (claims) section of a JWT without verifying the signature.
+
+    We don't verify the signature since tokens come from Databricks infrastructure
+    (either the X-Forwarded-Access-Token header, which is only set by Databricks
+    Apps, or credentials minted by the Databricks SDK). This is safe because the
+    tokens never pass through untrusted networks.
+
+    Results are LRU-cached keyed by the token string, so repeated requests
+    carrying the same token skip the base64+JSON parsing entirely. Callers
+    must treat the returned dict as read-only.
+
+    Raises:
+        ValueError: If the token is not a well-formed JWT.
+    """
+    # JWT tokens have format: header.payload.signature
+    # We only need the payload (middle section) for the claims
+    if token.count('.') != 2:
+        raise ValueError("Invalid JWT format")
+    payload = token.split('.', 2)[1]
+
+    # JWT uses URL-safe base64 encoding without padding; base64 strings must
+    # be multiples of 4, so pad up branch-free via the negated modulo
+    payload += '=' * (-len(payload) % 4)
+
+    # Decode from base64 and parse JSON to get claims
+    decoded = base64.urlsafe_b64decode(payload)
+    return json.loads(decoded)
+
 
 def _extract_username_from_token(token: str) -> str:
     """
     Extract username from JWT token without verification.
 
     Databricks OBO tokens are JWTs that contain user information in the payload.
-    We don't verify the signature since the token came from Databricks infrastructure
-    via the X-Forwarded-Access-Token header, which is only set by Databricks Apps.
-    This is safe because the token never passes through untrusted networks.
+    See _decode_jwt_payload for why skipping signature verification is safe here.
     """
     try:
-        # JWT tokens have format: header.payload.signature
-        # We only need the payload (middle section) for user information
-        parts = token.split('.')
-        if len(parts) != 3:
-            raise ValueError("Invalid JWT format")
-
-        # Decode the payload (second part) from base64
-        # JWT uses URL-safe base64 encoding without padding
-        payload = parts[1]
-
-        # Add padding if needed - base64 strings must be multiples of 4
-        # The modulo operation determines how many padding chars ('=') to add
-        padding = 4 - len(payload) % 4
-        if padding != 4:  # Only add padding if actually needed
-            payload += '=' * padding
-
-        # Decode from base64 and parse JSON to get claims
-        decoded = base64.urlsafe_b64decode(payload)
-        claims = json.loads(decoded)
+        claims = _decode_jwt_payload(token)
 
         # Try common username claims in order of preference
-        # Different OAuth providers use different claim names for username
-        for claim in ['email', 'sub', 'upn', 'preferred_username']:
+        for claim in _USERNAME_CLAIMS:
             if claim in claims:
                 username = claims[claim]
-                logger.debug(f"Extracted username from token claim '{claim}': {username}")
+                # %-style placeholders defer interpolation past the level
+                # check, so filtered DEBUG records cost no string work
+                logger.debug("Extracted username from token claim '%s': %s", claim, username)
                 return username
 
         raise ValueError(f"No username claim found in token. Available claims: {list(claims.keys())}")
@@ -55,6 +72,21 @@ def _extract_username_from_token(token: str) -> str:
         raise ValueError(f"Could not extract username from OBO token: {e}")
 
 
+@lru_cache(maxsize=128)
+def _obo_ws_for_token(token: str) -> WorkspaceClient:
+    """Build (and cache) a WorkspaceClient authenticated with an OBO token.
+
+    Constructing a client resolves the auth configuration and sets up an HTTP
+    session, so caching by token lets repeated requests from the same user
+    reuse the client and its pooled connections. The cache is bounded so
+    clients for rotated tokens age out.
+    """
+    # Create a workspace client using the OBO token
+    # auth_type="pat" tells the SDK to use the token as a personal access token
+    # We explicitly set this to avoid conflicts with default service principal authentication
+    return WorkspaceClient(token=token, auth_type="pat")
+
+
 def get_obo_ws(
     token: Annotated[str | None, Header(alias="X-Forwarded-Access-Token")] = None,
 ) -> WorkspaceClient:
@@ -74,12 +106,7 @@ def get_obo_ws(
             "OBO token is not provided in the header X-Forwarded-Access-Token"
         )
 
-    # Create a workspace client using the OBO token
-    # auth_type="pat" tells the SDK to use the token as a personal access token
-    # We explicitly set this to avoid conflicts with default service principal authentication
-    return WorkspaceClient(
-        token=token, auth_type="pat"
-    )
+    return _obo_ws_for_token(token)
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -105,6 +132,10 @@ def get_obo_session(
 
     For local development (no OBO token), falls back to the default session.
 
+    Sessions are always drawn from the shared, process-wide engine in `rt`,
+    so the connection pool (and its TCP/TLS handshakes) is reused across
+    requests instead of being rebuilt per request.
+
     Example usage:
     @api.get("/items/")
     async def read_items(session: Annotated[Session, Depends(get_obo_session)]):
@@ -122,7 +153,7 @@ def get_obo_session(
         # Extract username for application-level logging and audit trails
         # This allows us to track which user made each API request
         username = _extract_username_from_token(token)
-        logger.debug(f"Request from user: {username} (using service principal for database access)")
+        logger.debug("Request from user: %s (using service principal for database access)", username)
     else:
         # No OBO token present - running in local development mode
         logger.debug("Using default session (local development)")
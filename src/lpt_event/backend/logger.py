@@ -1,9 +1,70 @@
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 from .._metadata import app_name
 
 
+@lru_cache(maxsize=512)
+def _abbreviate_location(module: str, func_name: str, max_length: int = 20) -> str:
+    """
+    Abbreviate module and function name to fit within max_length.
+
+    Results are LRU-cached: a running app logs from a small, bounded set of
+    (module, function) call sites, so after warmup every record resolves its
+    location with a single dict hit instead of repeated string work.
+
+    Args:
+        module: Module name (may contain dots)
+        func_name: Function name
+        max_length: Maximum length of the combined string
+
+    Returns:
+        Abbreviated location string
+    """
+    # Handle case when function is <module> (module-level code)
+    if func_name == "<module>":
+        location = module if module else "<module>"
+    # Handle case when module is not provided
+    elif not module or module == "__main__":
+        location = func_name
+    else:
+        location = f"{module}.{func_name}"
+
+    # If it fits, return as-is
+    if len(location) <= max_length:
+        return location
+
+    # Try abbreviating module parts to first letter
+    if module and module != "__main__" and func_name != "<module>":
+        # Single character scan instead of split + comprehension + join:
+        # builds one output list with no intermediate parts lists
+        out = [module[0]]
+        module_len = len(module)
+        for i, ch in enumerate(module):
+            if ch == '.' and i + 1 < module_len:
+                out.append('.')
+                out.append(module[i + 1])
+        abbreviated_module = ''.join(out)
+        location = f"{abbreviated_module}.{func_name}"
+
+        # If still too long, truncate function name
+        if len(location) > max_length:
+            available_for_func = (
+                max_length - len(abbreviated_module) - 1
+            )  # -1 for the dot
+            if available_for_func > 0:
+                location = f"{abbreviated_module}.{func_name[:available_for_func]}"
+            else:
+                # Extreme case: just use abbreviated module
+                location = abbreviated_module[:max_length]
+    else:
+        # No module, just truncate function name (or module name if func is <module>)
+        location = location[:max_length]
+
+    return location
+
+
 class CustomFormatter(logging.Formatter):
     """Custom log formatter with colored output and pipe-separated format.
 
@@ -51,57 +112,31 @@ class CustomFormatter(logging.Formatter):
                 Colors are only applied if stderr is a TTY (terminal).
         """
         super().__init__()
+        # Let the base formatTime build the timestamp: its default time
+        # format already matches ours, and it appends milliseconds through
+        # this template (stdlib default uses a comma; we want a dot)
+        self.default_msec_format = "%s.%03d"
         self.use_colors = use_colors
-
-    def _abbreviate_location(
-        self, module: str, func_name: str, max_length: int = 20
-    ) -> str:
-        """
-        Abbreviate module and function name to fit within max_length.
-
-        Args:
-            module: Module name (may contain dots)
-            func_name: Function name
-            max_length: Maximum length of the combined string
-
-        Returns:
-            Abbreviated location string
-        """
-        # Handle case when function is <module> (module-level code)
-        if func_name == "<module>":
-            location = module if module else "<module>"
-        # Handle case when module is not provided
-        elif not module or module == "__main__":
-            location = func_name
-        else:
-            location = f"{module}.{func_name}"
-
-        # If it fits, return as-is
-        if len(location) <= max_length:
-            return location
-
-        # Try abbreviating module parts to first letter
-        if module and module != "__main__" and func_name != "<module>":
-            parts = module.split(".")
-            abbreviated_parts = [p[0] for p in parts]
-            abbreviated_module = ".".join(abbreviated_parts)
-            location = f"{abbreviated_module}.{func_name}"
-
-            # If still too long, truncate function name
-            if len(location) > max_length:
-                available_for_func = (
-                    max_length - len(abbreviated_module) - 1
-                )  # -1 for the dot
-                if available_for_func > 0:
-                    location = f"{abbreviated_module}.{func_name[:available_for_func]}"
-                else:
-                    # Extreme case: just use abbreviated module
-                    location = abbreviated_module[:max_length]
-        else:
-            # No module, just truncate function name (or module name if func is <module>)
-            location = location[:max_length]
-
-        return location
+        # isatty() costs a syscall and stderr's tty-ness doesn't change while
+        # the process runs, so decide colorization once up front
+        self._colorize = use_colors and sys.stderr.isatty()
+        # Pre-build the padded level strings (plain and colored) so format()
+        # does a dict lookup instead of rebuilding them per record. Keyed by
+        # the numeric level rather than the name: integer hashing is cheaper
+        # than string hashing for the per-record lookup
+        self._level_plain = {
+            logging.getLevelName(lvl): f"{lvl:8s}"
+            for lvl in self.COLORS
+            if lvl != "RESET"
+        }
+        self._level_colored = {
+            logging.getLevelName(lvl): f"{self.COLORS[lvl]}{lvl:8s}{self.COLORS['RESET']}"
+            for lvl in self.COLORS
+            if lvl != "RESET"
+        }
+        # The app-name segment is identical on every line - pad it once here
+        # instead of re-running the format conversion per record
+        self._app_prefix = f" | {app_name:12s} | "
 
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record into a pipe-separated string with colors.
@@ -126,10 +161,10 @@ class CustomFormatter(logging.Formatter):
             >>> print(formatted)
             2024-01-09 10:30:45.123 | lpt-event    | INFO     | runtime.validate_db  | Database validated
         """
-        # Get the time with milliseconds
-        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
-        # Add milliseconds
-        timestamp = f"{timestamp}.{int(record.msecs):03d}"
+        # Delegate to the stock formatTime (no datefmt, so the msec template
+        # set in __init__ applies) - it handles the converter and msec
+        # append in one place instead of a hand-rolled strftime + f-string
+        timestamp = self.formatTime(record)
 
         # Get the module name
         module = record.module
@@ -138,26 +173,20 @@ class CustomFormatter(logging.Formatter):
         func_name = record.funcName
 
         # Combine and abbreviate module and function name
-        location = self._abbreviate_location(module, func_name, max_length=20)
-
-        # Get log level
-        level = record.levelname
+        location = _abbreviate_location(module, func_name, max_length=20)
 
-        # Apply colors if enabled
-        if self.use_colors and sys.stderr.isatty():
-            level_color = self.COLORS.get(level, self.COLORS["RESET"])
-            reset_color = self.COLORS["RESET"]
-            colored_level = f"{level_color}{level:8s}{reset_color}"
-        else:
-            colored_level = f"{level:8s}"
+        # Apply colors if enabled (strings precomputed per level at init,
+        # looked up by levelno; unknown custom levels fall back to plain)
+        levels = self._level_colored if self._colorize else self._level_plain
+        colored_level = levels.get(record.levelno) or f"{record.levelname:8s}"
 
         # Format the message
         message = record.getMessage()
 
-        # Create the pipe-separated format
-        log_line = (
-            f"{timestamp} | {app_name:12s} | {colored_level} | "
-            f"{location:20s} | {message}"
+        # Create the pipe-separated format - joining precomputed segments
+        # beats one big f-string when the constant parts dominate
+        log_line = "".join(
+            (timestamp, self._app_prefix, colored_level, " | ", f"{location:20s}", " | ", message)
         )
 
         # Add exception info if present
@@ -147,7 +147,20 @@ class EventRead(BaseModel):
 
     # Allow this model to be created from SQLAlchemy/SQLModel ORM objects
     # This enables: EventRead.model_validate(event_row)
-    model_config = ConfigDict(from_attributes=True)
+    #
+    # The remaining settings tune the hot list-response path:
+    # - defer_build=False builds the Rust validator/serializer at import
+    #   instead of on the first request
+    # - revalidate_instances='never' skips re-running validators on model
+    #   instances that pass through nested validation
+    # - extra='ignore' drops unknown attributes instead of erroring, which
+    #   also keeps the per-instance footprint fixed
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=False,
+        revalidate_instances="never",
+        extra="ignore",
+    )
 
     id: int
     title: str
@@ -1,7 +1,9 @@
+import hashlib
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session, delete, select
 
 from databricks.sdk.service.iam import User as UserOut
 
@@ -11,11 +13,28 @@ from .dependencies import get_obo_session
 
 api = APIRouter(prefix=conf.api_prefix)
 
+# Package metadata is fixed once the process starts - compute the version
+# payload a single time instead of per request
+_VERSION = VersionOut.from_metadata()
+
+# The mocked local-development user never changes - build it once at import
+# instead of allocating a new UserOut on every /current-user request
+_LOCAL_USER = UserOut(
+    id="local-user",
+    user_name="local.user@example.com",
+    display_name="Local User",
+    active=True,
+    emails=[],
+    roles=[],
+    groups=[],
+    entitlements=[],
+)
+
 
 @api.get("/version", response_model=VersionOut, operation_id="version")
 async def version():
     """Return application version from package metadata."""
-    return VersionOut.from_metadata()
+    return _VERSION
 
 
 @api.get("/current-user", response_model=UserOut, operation_id="currentUser")
@@ -28,39 +47,73 @@ def me_mock() -> UserOut:
     This mock allows the frontend to work seamlessly in local development
     without requiring OAuth/OBO tokens.
     """
-    return UserOut(
-        id="local-user",
-        user_name="local.user@example.com",
-        display_name="Local User",
-        active=True,
-        emails=[],
-        roles=[],
-        groups=[],
-        entitlements=[],
-    )
+    return _LOCAL_USER
 
 
 # --- Event endpoints ---
 # All endpoints use get_obo_session for database access with user authentication
+#
+# Handlers are async so only the blocking database calls occupy a threadpool
+# worker (via run_in_threadpool); payload parsing and response construction
+# run directly on the event loop.
 
 
 @api.get("/events", response_model=List[EventRead], operation_id="listEvents")
-def list_events(session: Annotated[Session, Depends(get_obo_session)]):
+async def list_events(
+    request: Request,
+    response: Response,
+    session: Annotated[Session, Depends(get_obo_session)],
+):
     """
     List all events from the database.
 
     Returns whatever is in the database - seeding of demo data happens during startup.
+    Supports conditional requests: clients that replay the ETag via If-None-Match
+    get a bodyless 304 when the list content hasn't changed.
     """
-    # Query all events from the database
-    events = session.exec(select(Event)).all()
-
-    # Convert ORM objects to Pydantic response models
-    # model_validate() handles the conversion from SQLModel attributes to Pydantic fields
-    return [EventRead.model_validate(e) for e in events]
+    # Select plain columns instead of ORM entities - this read-only path
+    # doesn't need per-row attribute instrumentation or identity-map
+    # bookkeeping, so Core rows are materially cheaper to hydrate
+    def _query():
+        return session.exec(
+            select(
+                Event.id,
+                Event.title,
+                Event.short_description,
+                Event.detailed_description,
+                Event.city,
+                Event.days_of_week,
+                Event.cost_usd,
+                Event.picture_url,
+            )
+        ).all()
+
+    rows = await run_in_threadpool(_query)
+
+    # Content hash of the fetched rows: unlike a count/max-id aggregate, this
+    # changes on UPDATEs too, so polling clients never hold a stale list. The
+    # rows are already in hand either way - a 304 saves the Pydantic
+    # construction, JSON serialization, and response bytes, not the fetch
+    digest = hashlib.md5()
+    for row in rows:
+        digest.update(repr(row._tuple()).encode())
+    etag = f'W/"{digest.hexdigest()}"'
+
+    if request.headers.get("if-none-match") == etag:
+        # RFC 9110: a 304 carries the same ETag the full response would have
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, must-revalidate"
+
+    # Build response models with model_construct() - these rows come straight
+    # from the database and were validated on the way in, so re-running the
+    # Pydantic validators for every field of every row is pure overhead
+    return [EventRead.model_construct(**row._mapping) for row in rows]
 
 
 @api.post("/events", response_model=EventRead, operation_id="createEvent")
-def create_event(
+async def create_event(
     payload: EventCreate,
     session: Annotated[Session, Depends(get_obo_session)],
 ):
@@ -70,45 +123,67 @@ def create_event(
     The payload uses Pydantic's HttpUrl for validation, but we store it as a plain string
     in the database to avoid SQLAlchemy type complexity.
     """
-    # Convert Pydantic model to dict
-    event_data = payload.model_dump()
+    # Convert Pydantic model to dict in JSON mode - this coerces HttpUrl (and
+    # any future rich types) to plain strings in a single serializer pass, so
+    # no per-field fixup is needed before database storage
+    event_data = payload.model_dump(mode='json')
+
+    # Create Event table instance and persist to database. SQLModel skips
+    # the Pydantic validator chain for table=True models, so this is already
+    # a construct-only path; model_construct() would be no faster and would
+    # bypass SQLAlchemy's instrumented __init__, leaving the instance
+    # without the ORM state that session.add() requires
+    event = Event(**event_data)
 
-    # Convert HttpUrl to string for database storage
-    # Pydantic's HttpUrl is a special type that doesn't play well with SQLAlchemy
-    event_data['picture_url'] = str(payload.picture_url)
+    def _persist():
+        session.add(event)
+        session.flush()  # Runs the INSERT; the auto-generated ID is populated here
 
-    # Create Event table instance and persist to database
-    event = Event(**event_data)
-    session.add(event)
-    session.commit()  # Write to database
-    session.refresh(event)  # Load back the auto-generated ID
+        # Build the response before commit (commit expires ORM attributes, and
+        # a refresh would cost an extra SELECT round-trip just to re-read them)
+        response = EventRead.model_validate(event)
+        session.commit()  # Write to database
+        return response
 
-    # Convert ORM object to response model
-    return EventRead.model_validate(event)
+    return await run_in_threadpool(_persist)
 
 
 @api.get("/events/{event_id}", response_model=EventRead, operation_id="getEvent")
-def get_event(
+async def get_event(
     event_id: int,
+    request: Request,
+    response: Response,
     session: Annotated[Session, Depends(get_obo_session)],
 ):
     """
     Fetch a single event by ID.
 
-    Returns 404 if event doesn't exist.
+    Returns 404 if event doesn't exist, and 304 when the client's
+    If-None-Match ETag still matches the row's content.
     """
     # session.get() is the shorthand for querying by primary key
-    event = session.get(Event, event_id)
+    event = await run_in_threadpool(session.get, Event, event_id)
 
     if not event:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Event not found")
 
-    return EventRead.model_validate(event)
+    payload = EventRead.model_validate(event)
+
+    # Single rows have no version column, so the ETag is a content hash of
+    # the serialized payload - the row is already in hand, so this only
+    # saves the response bytes and re-download, not the fetch itself
+    etag = f'W/"{hashlib.md5(payload.model_dump_json().encode()).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        # RFC 9110: a 304 carries the same ETag the full response would have
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, must-revalidate"
+    return payload
 
 
 @api.put("/events/{event_id}", response_model=EventRead, operation_id="updateEvent")
-def update_event(
+async def update_event(
     event_id: int,
     payload: EventUpdate,
     session: Annotated[Session, Depends(get_obo_session)],
@@ -119,35 +194,34 @@ def update_event(
     Only fields provided in the payload will be updated.
     All fields are optional in EventUpdate model.
     """
-    from fastapi import HTTPException
-
     # First verify the event exists
-    event = session.get(Event, event_id)
+    event = await run_in_threadpool(session.get, Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
     # Extract only the fields that were provided in the request
     # exclude_unset=True means fields not sent in the request are ignored
     # This enables partial updates (e.g., only updating the title)
-    update_data = payload.model_dump(exclude_unset=True)
-
-    # Convert HttpUrl to string if picture_url was provided
-    if 'picture_url' in update_data and update_data['picture_url'] is not None:
-        update_data['picture_url'] = str(update_data['picture_url'])
+    # mode='json' coerces HttpUrl values to plain strings in the same pass
+    update_data = payload.model_dump(exclude_unset=True, mode='json')
 
-    # Update each provided field on the existing event object
-    for field, value in update_data.items():
-        setattr(event, field, value)
+    # Apply all provided fields in one call. sqlmodel_update assigns through
+    # the instrumented attributes (unlike writing to __dict__, which would
+    # bypass change tracking and silently skip the UPDATE), while avoiding
+    # the Python-level setattr loop here
+    event.sqlmodel_update(update_data)
 
-    session.add(event)
-    session.commit()  # Persist changes to database
-    session.refresh(event)  # Reload to get any database-computed fields
+    def _persist():
+        session.add(event)
+        session.commit()  # Persist changes to database
+        session.refresh(event)  # Reload to get any database-computed fields
+        return EventRead.model_validate(event)
 
-    return EventRead.model_validate(event)
+    return await run_in_threadpool(_persist)
 
 
 @api.delete("/events/{event_id}", operation_id="deleteEvent")
-def delete_event(
+async def delete_event(
     event_id: int,
     session: Annotated[Session, Depends(get_obo_session)],
 ):
@@ -157,16 +231,19 @@ def delete_event(
     Returns 404 if event doesn't exist.
     Returns success message if deletion succeeds.
     """
-    from fastapi import HTTPException
-
-    # Verify event exists before attempting deletion
-    event = session.get(Event, event_id)
-    if not event:
+    # Delete and check existence in a single round-trip: RETURNING tells us
+    # whether a row was actually removed, so no SELECT-before-DELETE is needed
+    def _delete():
+        result = session.execute(
+            delete(Event).where(Event.id == event_id).returning(Event.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        if deleted:
+            session.commit()
+        return deleted
+
+    if not await run_in_threadpool(_delete):
         raise HTTPException(status_code=404, detail="Event not found")
 
-    # Delete the event from the database
-    session.delete(event)
-    session.commit()
-
     # Return success response
     return {"ok": True, "message": f"Event {event_id} deleted successfully"}
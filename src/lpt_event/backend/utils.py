@@ -1,10 +1,226 @@
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 from .config import conf
 from .logger import logger
 
 
+# Matches paths whose final segment contains a dot (e.g. /missing.js,
+# /img/logo.png) - i.e. requests for concrete files rather than SPA routes.
+# Compiled once; the match loop runs in C instead of Python-level scanning.
+_ASSET_RE = re.compile(r"/[^/]*\.[^/]*$")
+
+
+# The overwhelming majority of 404s carry Starlette's default detail, so its
+# body is frozen at import time and skips even the cache lookup. A fresh
+# Response is still built per request - Response.headers is mutable and
+# middleware (CORS, etc.) may write to it, so a shared instance would leak
+# header mutations across requests.
+_DEFAULT_404_BODY = b'{"detail":"Not Found"}'
+
+
+@lru_cache(maxsize=64)
+def _error_body(detail: str) -> bytes:
+    """Serialized JSON error payload, cached per detail string.
+
+    404 details repeat endlessly (the default "Not Found" plus a handful of
+    endpoint-specific messages), so after warmup each error response reuses
+    prebuilt bytes instead of re-serializing.
+    """
+    return orjson.dumps({"detail": detail})
+
+
+@dataclass(frozen=True, slots=True)
+class _SpaFallback:
+    """Precomputed state for the 404 handler, stored on ``app.state``.
+
+    A frozen slotted container keeps the per-request reads down to plain
+    attribute loads, which CPython's adaptive interpreter specializes.
+    """
+
+    excluded_prefixes: tuple[str, ...]
+    index_bytes: bytes | None
+    index_etag: str | None
+
+
+async def _not_found_handler(request: Request, exc: StarletteHTTPException):
+    """Handle 404 responses, serving the SPA entry point where appropriate.
+
+    Registered for status 404 only, so there is no status check here -
+    other HTTP errors never enter this handler. Module-level (rather than a
+    closure) so name lookups go through CPython's specialized LOAD_GLOBAL
+    inline caches instead of closure cell dereferences; configuration comes
+    from the ``_SpaFallback`` installed on ``app.state``.
+
+    Args:
+        request (Request): The incoming request that caused the exception.
+        exc (StarletteHTTPException): The 404 exception that was raised.
+
+    Returns:
+        Response: Either the in-memory SPA index.html (or a 304 when the
+            client's ETag matches) for client-side routing, or a JSON error
+            response for actual 404 errors.
+    """
+    # DEBUG with %-style placeholders: crawler-driven 404 floods would
+    # otherwise pay eager f-string formatting plus a log emit each, and
+    # at the default INFO level this line now costs a single level check
+    logger.debug("Not-found handler called for request %s", request.url.path)
+
+    # Method gate first: only GETs can ever be SPA navigations, so
+    # mutation 404s (POST/PUT/DELETE against unknown API paths) skip the
+    # path and Accept inspection entirely
+    if request.method == "GET":
+        spa: _SpaFallback = request.app.state.spa_fallback
+        if spa.index_bytes is not None:
+            path = request.url.path
+
+            is_api = path.startswith(spa.excluded_prefixes)
+
+            # Browsers tag real navigations with Sec-Fetch-Dest: document -
+            # one short token compare. Only clients that omit the header
+            # (curl, old browsers) fall back to the Accept substring scan
+            dest = request.headers.get("sec-fetch-dest")
+            is_page_nav = dest == "document" or (
+                dest is None and "text/html" in request.headers.get("accept", "")
+            )
+
+            # Heuristic: if the last path segment looks like a file (has a dot), don't SPA-fallback
+            # This prevents serving index.html for requests like /missing.js or /logo.png
+            looks_like_asset = _ASSET_RE.search(path) is not None
+
+            if (not is_api) and is_page_nav and (not looks_like_asset):
+                # Let the SPA router handle it by serving the index.html
+                # The frontend router (TanStack Router) will then handle the actual routing
+                if request.headers.get("if-none-match") == spa.index_etag:
+                    return Response(status_code=304)
+                return Response(
+                    content=spa.index_bytes,
+                    media_type="text/html; charset=utf-8",
+                    headers={"ETag": spa.index_etag, "Cache-Control": "no-cache"},
+                )
+    # Default: return the original JSON 404 (API routes, assets, non-GET).
+    # The stock "Not Found" detail serves import-time frozen bytes, other
+    # string details hit the prebuilt-bytes cache, and anything richer goes
+    # through orjson directly
+    if exc.detail == "Not Found":
+        return Response(
+            content=_DEFAULT_404_BODY,
+            media_type="application/json",
+            status_code=404,
+        )
+    if isinstance(exc.detail, str):
+        return Response(
+            content=_error_body(exc.detail),
+            media_type="application/json",
+            status_code=404,
+        )
+    return Response(
+        content=orjson.dumps({"detail": exc.detail}),
+        media_type="application/json",
+        status_code=404,
+    )
+
+
+# Paths probed by automated vulnerability scanners. None of these can ever
+# exist in this app, so requests for them are answered before the routing
+# table, exception-handler pipeline, and SPA detection even run. frozenset
+# membership is a single C-level hash lookup per request.
+_SCAN_PATHS = frozenset(
+    {
+        "/.env",
+        "/.env.bak",
+        "/.git/config",
+        "/.git/HEAD",
+        "/.aws/credentials",
+        "/wp-login.php",
+        "/wp-admin/setup-config.php",
+        "/xmlrpc.php",
+        "/phpmyadmin/index.php",
+        "/config.php",
+        "/admin.php",
+    }
+)
+
+# Prebuilt ASGI messages for the short-circuit reply; the same immutable
+# dicts and bytes are sent for every hit, so the hot path allocates nothing
+_SCAN_BODY = b'{"detail":"Not Found"}'
+_SCAN_RESPONSE_START = {
+    "type": "http.response.start",
+    "status": 404,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_SCAN_BODY)).encode()),
+    ],
+}
+_SCAN_RESPONSE_BODY = {"type": "http.response.body", "body": _SCAN_BODY}
+
+
+class ScanPathFilter:
+    """Pure-ASGI middleware that short-circuits known scanner probes.
+
+    Internet-facing deployments see a steady drip of requests for paths like
+    /.env and /wp-login.php. Each one would otherwise walk the full Starlette
+    middleware stack, miss every route, raise an HTTPException, and run the
+    SPA-aware 404 handler - all to produce a 404 nobody reads. This
+    middleware answers them with precomputed bytes before any of that
+    machinery is built, keeping the useless traffic class off the hot path.
+
+    Legitimate requests pass straight through with one frozenset lookup of
+    overhead.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in _SCAN_PATHS:
+            await send(_SCAN_RESPONSE_START)
+            await send(_SCAN_RESPONSE_BODY)
+            return
+        await self.app(scope, receive, send)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that attaches Cache-Control headers based on the path.
+
+    The frontend build (Vite) emits content-hashed filenames under assets/,
+    so those files never change in place and browsers can cache them forever.
+    Everything else - most importantly index.html - must be revalidated on
+    each navigation so new deployments are picked up immediately.
+
+    Serving from the browser cache removes the request from the server's
+    network path entirely, which is the cheapest way to serve an SPA bundle.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve a static file with an appropriate Cache-Control header.
+
+        Args:
+            path (str): The requested file path, relative to the mount.
+            scope (Scope): The ASGI scope for the request.
+
+        Returns:
+            Response: The file response with caching headers attached.
+        """
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            if path.startswith("assets/"):
+                # Content-hashed bundle files: safe to cache indefinitely
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+            else:
+                # index.html and friends: always revalidate with the server
+                response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
 def add_not_found_handler(app: FastAPI):
     """Register a custom 404 handler that supports SPA client-side routing.
 
@@ -31,36 +247,39 @@ def add_not_found_handler(app: FastAPI):
         This must be called after mounting static files but can be called anytime
         after the FastAPI app is created.
     """
-    async def http_exception_handler(request: Request, exc: StarletteHTTPException):
-        """Handle HTTP exceptions, especially 404s for SPA routing support.
-
-        Args:
-            request (Request): The incoming request that caused the exception.
-            exc (StarletteHTTPException): The HTTP exception that was raised.
-
-        Returns:
-            FileResponse | JSONResponse: Either the SPA index.html for client-side routing
-                or a JSON error response for actual 404 errors.
-        """
-        logger.info(
-            f"HTTP exception handler called for request {request.url.path} with status code {exc.status_code}"
-        )
-        if exc.status_code == 404:
-            path = request.url.path
-            accept = request.headers.get("accept", "")
-
-            is_api = path.startswith(conf.api_prefix)
-            is_get_page_nav = request.method == "GET" and "text/html" in accept
-
-            # Heuristic: if the last path segment looks like a file (has a dot), don't SPA-fallback
-            # This prevents serving index.html for requests like /missing.js or /logo.png
-            looks_like_asset = "." in path.split("/")[-1]
+    # The SPA entry point is baked into the package at build time and cannot
+    # change while the process runs, so read it into memory once here. Every
+    # fallback then serves straight from this buffer - no per-request open,
+    # stat, or file streaming. The ETag lets repeat navigations revalidate
+    # with a bodyless 304.
+    index_path = conf.static_assets_path / "index.html"
+    try:
+        index_bytes = index_path.read_bytes()
+        index_etag = f'"{hashlib.blake2b(index_bytes, digest_size=16).hexdigest()}"'
+    except OSError:
+        # No built frontend (backend-only development run): SPA fallback is
+        # disabled and unmatched page navigations get the JSON 404
+        index_bytes = None
+        index_etag = None
 
-            if (not is_api) and is_get_page_nav and (not looks_like_asset):
-                # Let the SPA router handle it by serving the index.html
-                # The frontend router (TanStack Router) will then handle the actual routing
-                return FileResponse(conf.static_assets_path / "index.html")
-        # Default: return the original HTTP error (JSON 404 for API, etc.)
-        return JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
+    # Per-request constants live in a frozen container on app.state: config
+    # attribute access and the pydantic model lookup behind it are not free
+    # on a hot 404 path. Besides the API prefix, exclude machine-facing
+    # paths (OpenAPI discovery probes, health/metrics scrapers) from the SPA
+    # fallback - str.startswith scans the whole tuple in a single C-level call
+    app.state.spa_fallback = _SpaFallback(
+        excluded_prefixes=(
+            conf.api_prefix,
+            "/docs",
+            "/redoc",
+            "/openapi.json",
+            "/metrics",
+            "/healthz",
+        ),
+        index_bytes=index_bytes,
+        index_etag=index_etag,
+    )
 
-    app.exception_handler(StarletteHTTPException)(http_exception_handler)
+    # Register for status 404 only; Starlette's stock handler keeps serving
+    # every other HTTPException without entering custom Python code
+    app.add_exception_handler(404, _not_found_handler)
